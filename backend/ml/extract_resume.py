@@ -1,19 +1,135 @@
 #!/usr/bin/env python3
 import sys
-import json
 import re
-import spacy
+import ahocorasick
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# Load spaCy model
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    print(json.dumps({"error": "spaCy model 'en_core_web_sm' not found. Run: python -m spacy download en_core_web_sm"}), file=sys.stderr)
-    sys.exit(1)
+_ORG_SUFFIXES = ["University", "College", "Institute", "Academy", "School",
+                 "Inc", "LLC", "Ltd", "Corp", "Corporation", "Company",
+                 "Technologies", "Labs", "Solutions", "Systems"]
 
+# Rule-based pipeline: only PERSON/ORG-style lookups are needed, which simple
+# heuristics cover without the statistical model's ~50MB load and CNN pass.
+# Built lazily since resumes without experience/education sections never need it
+_nlp = None
+_org_matcher = None
 
-def extract_contact_info(text):
+
+def get_nlp():
+    """Build the spaCy tokenizer and ORG matcher on first use"""
+    global _nlp, _org_matcher
+
+    if _nlp is None:
+        import spacy
+        from spacy.matcher import PhraseMatcher
+
+        _nlp = spacy.blank("en")
+        _org_matcher = PhraseMatcher(_nlp.vocab, attr="LOWER")
+        _org_matcher.add("ORG_SUFFIX", [_nlp.make_doc(s) for s in _ORG_SUFFIXES])
+
+    return _nlp
+
+# Pre-compiled patterns (compiling per call pays re's cache-lookup cost every time)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# Phone formats merged into one alternation, longest variant first
+_PHONE_RE = re.compile(
+    r'(\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+    r'|(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+    r'|(\d{10})'
+)
+_LINKEDIN_RE = re.compile(r'linkedin\.com/in/([a-zA-Z0-9-]+)', re.IGNORECASE)
+_GITHUB_RE = re.compile(r'github\.com/([a-zA-Z0-9-]+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}|\d{4})', re.IGNORECASE)
+_YEAR_RE = re.compile(r'\b(19\d{2}|20\d{2})\b')
+_EXP_SPLIT_RE = re.compile(r'\n(?=\d{4}|\w+\s+\d{4})')
+_EDU_SPLIT_RE = re.compile(r'\n(?=\d{4}|Bachelor|Master|PhD|B\.)', re.IGNORECASE)
+# Title/mixed-case name lines ("John Smith", "Ronald McDonald", "Pat O'Brien")
+# and ALL-CAPS header lines ("JOHN SMITH"), checked in that order
+_NAME_LINE_RE = re.compile(r"^([A-Z][a-zA-Z'.-]*[a-z][a-zA-Z'.-]*(?:\s+[A-Z][a-zA-Z'.-]*){1,3})\s*$")
+_CAPS_NAME_LINE_RE = re.compile(r"^([A-Z][A-Z'.-]+(?:\s+[A-Z][A-Z'.-]+){1,3})\s*$")
+
+SECTION_HEADERS = ["experience", "education", "skills", "projects", "certifications",
+                   "awards", "summary", "objective", "references"]
+
+_SECTION_KEYWORDS = ["experience", "work history", "employment", "professional experience",
+                     "education", "academic", "qualifications", "degree"]
+
+# One alternation over every known header, longest first so "professional
+# experience" wins over "experience"; anchored to line starts so body text
+# mentioning a header word is not treated as a section break
+_ALL_HEADERS = sorted(set(SECTION_HEADERS + _SECTION_KEYWORDS), key=len, reverse=True)
+_ALL_HEADERS_RE = re.compile(r'(?m)^[ \t]*(' + '|'.join(_ALL_HEADERS) + r')\b', re.IGNORECASE)
+
+# Words that disqualify a capitalized line from being the candidate name
+_NAME_STOPWORDS = set(' '.join(_ALL_HEADERS).split()) | {"curriculum", "vitae", "resume", "cv"}
+
+# Input cap: anything past this is not a plausible resume and only inflates
+# the strings every pass must traverse
+_MAX_INPUT_BYTES = 512 * 1024
+
+# Common degree keywords, pre-lowered for substring lookup
+DEGREES = ["Bachelor", "Master", "PhD", "B.Tech", "M.Tech", "B.S.", "M.S.",
+           "BA", "MA", "MBA", "B.E.", "M.E.", "Associate"]
+_DEGREE_LOOKUP = [(degree.lower(), degree) for degree in DEGREES]
+
+# Expanded skill keywords (canonical casing; the automaton below holds the
+# lowered form, so nothing is re-lowered per resume)
+SKILL_KEYWORDS = frozenset({
+    # Programming Languages
+    "Python", "JavaScript", "Java", "C++", "C#", "Ruby", "PHP", "Swift",
+    "Kotlin", "Go", "Rust", "TypeScript", "R", "MATLAB", "Scala", "Perl",
+
+    # Web Technologies
+    "HTML", "CSS", "React", "Angular", "Vue.js", "Node.js", "Express.js",
+    "Django", "Flask", "FastAPI", "Spring Boot", "ASP.NET", "jQuery",
+    "Next.js", "Nuxt.js", "Svelte", "Tailwind CSS", "Bootstrap",
+
+    # Databases
+    "SQL", "MySQL", "PostgreSQL", "MongoDB", "Redis", "Cassandra",
+    "Oracle", "SQLite", "DynamoDB", "Firebase", "Neo4j", "MariaDB",
+
+    # Cloud & DevOps
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Jenkins", "CI/CD",
+    "Terraform", "Ansible", "Git", "GitHub", "GitLab", "Bitbucket",
+    "Linux", "Unix", "Shell Scripting", "Bash",
+
+    # Data Science & ML
+    "Machine Learning", "Deep Learning", "TensorFlow", "PyTorch", "Keras",
+    "Scikit-learn", "Pandas", "NumPy", "NLP", "Computer Vision", "AI",
+    "Data Analysis", "Statistics", "Tableau", "Power BI", "Spark",
+
+    # Mobile Development
+    "Android", "iOS", "React Native", "Flutter", "Xamarin",
+
+    # Other
+    "REST API", "GraphQL", "Microservices", "Agile", "Scrum", "JIRA",
+    "Testing", "Unit Testing", "Jest", "Pytest", "Selenium"
+})
+
+# One-pass multi-pattern scanner: all keywords are found in a single traversal
+# of the text instead of one substring scan per keyword
+_SKILL_AC = ahocorasick.Automaton()
+for _skill in SKILL_KEYWORDS:
+    _SKILL_AC.add_word(_skill.lower(), _skill)
+_SKILL_AC.make_automaton()
+
+
+def _scan_skills(text_lower: str) -> set[str]:
+    """Find all skill keywords in one pass, keeping only word-bounded matches"""
+    found = set()
+    for end, skill in _SKILL_AC.iter(text_lower):
+        start = end - len(skill) + 1
+        if start > 0 and text_lower[start - 1].isalnum():
+            continue
+        if end + 1 < len(text_lower) and text_lower[end + 1].isalnum():
+            continue
+        found.add(skill)
+    return found
+
+
+def extract_contact_info(text: str) -> dict:
     """Extract email, phone, and name from resume text"""
     contact = {
         "email": None,
@@ -24,228 +140,239 @@ def extract_contact_info(text):
     }
     
     # Email extraction
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
+    emails = _EMAIL_RE.findall(text)
     if emails:
         contact["email"] = emails[0]
-    
+
     # Phone extraction (various formats)
-    phone_patterns = [
-        r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-        r'\d{10}',
-    ]
-    for pattern in phone_patterns:
-        phones = re.findall(pattern, text)
-        if phones:
-            contact["phone"] = phones[0]
-            break
-    
+    phone_match = _PHONE_RE.search(text)
+    if phone_match:
+        contact["phone"] = next(g for g in phone_match.groups() if g)
+
     # LinkedIn
-    linkedin_match = re.search(r'linkedin\.com/in/([a-zA-Z0-9-]+)', text, re.IGNORECASE)
+    linkedin_match = _LINKEDIN_RE.search(text)
     if linkedin_match:
         contact["linkedin"] = f"linkedin.com/in/{linkedin_match.group(1)}"
-    
+
     # GitHub
-    github_match = re.search(r'github\.com/([a-zA-Z0-9-]+)', text, re.IGNORECASE)
+    github_match = _GITHUB_RE.search(text)
     if github_match:
         contact["github"] = f"github.com/{github_match.group(1)}"
-    
-    # Name extraction (first PERSON entity, usually at top)
-    doc = nlp(text[:500])  # Check only first 500 chars for name
-    for ent in doc.ents:
-        if ent.label_ == "PERSON" and len(ent.text.split()) <= 4:
-            contact["name"] = ent.text
-            break
-    
+
     return contact
 
 
-def extract_skills(text):
+def extract_name(text: str) -> str | None:
+    """Extract candidate name (capitalized line near the top)"""
+    lines = [line.strip() for line in text[:500].splitlines()]
+
+    for pattern, all_caps in ((_NAME_LINE_RE, False), (_CAPS_NAME_LINE_RE, True)):
+        for line in lines:
+            match = pattern.match(line)
+            if not match:
+                continue
+            if any(word in _NAME_STOPWORDS for word in match.group(1).lower().split()):
+                continue
+            return match.group(1).title() if all_caps else match.group(1)
+
+    return None
+
+
+def extract_orgs(doc) -> list[str]:
+    """Find organization names via suffix terms and adjacent capitalized tokens"""
+    orgs = []
+    seen = set()
+
+    for _, start, end in _org_matcher(doc):
+        # Walk left over capitalized tokens ("Acme Technologies")
+        left = start
+        while left > 0 and doc[left - 1].text[:1].isupper() and not doc[left - 1].is_punct:
+            left -= 1
+
+        # Extend right through "of ..." style names ("University of California")
+        right = end
+        if right < len(doc) and doc[right].text.lower() == "of":
+            right += 1
+            while right < len(doc) and doc[right].text[:1].isupper() and not doc[right].is_punct:
+                right += 1
+
+        name = doc[left:right].text.strip()
+        if name and name not in seen:
+            seen.add(name)
+            orgs.append(name)
+
+    return orgs
+
+
+def extract_skills(text: str) -> list[str]:
     """Extract technical skills from resume"""
-    # Expanded skill keywords
-    skill_keywords = {
-        # Programming Languages
-        "Python", "JavaScript", "Java", "C++", "C#", "Ruby", "PHP", "Swift", 
-        "Kotlin", "Go", "Rust", "TypeScript", "R", "MATLAB", "Scala", "Perl",
-        
-        # Web Technologies
-        "HTML", "CSS", "React", "Angular", "Vue.js", "Node.js", "Express.js",
-        "Django", "Flask", "FastAPI", "Spring Boot", "ASP.NET", "jQuery",
-        "Next.js", "Nuxt.js", "Svelte", "Tailwind CSS", "Bootstrap",
-        
-        # Databases
-        "SQL", "MySQL", "PostgreSQL", "MongoDB", "Redis", "Cassandra",
-        "Oracle", "SQLite", "DynamoDB", "Firebase", "Neo4j", "MariaDB",
-        
-        # Cloud & DevOps
-        "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Jenkins", "CI/CD",
-        "Terraform", "Ansible", "Git", "GitHub", "GitLab", "Bitbucket",
-        "Linux", "Unix", "Shell Scripting", "Bash",
-        
-        # Data Science & ML
-        "Machine Learning", "Deep Learning", "TensorFlow", "PyTorch", "Keras",
-        "Scikit-learn", "Pandas", "NumPy", "NLP", "Computer Vision", "AI",
-        "Data Analysis", "Statistics", "Tableau", "Power BI", "Spark",
-        
-        # Mobile Development
-        "Android", "iOS", "React Native", "Flutter", "Xamarin",
-        
-        # Other
-        "REST API", "GraphQL", "Microservices", "Agile", "Scrum", "JIRA",
-        "Testing", "Unit Testing", "Jest", "Pytest", "Selenium"
-    }
-    
-    # Case-insensitive matching
-    found_skills = []
-    text_lower = text.lower()
-    
-    for skill in skill_keywords:
-        if skill.lower() in text_lower:
-            found_skills.append(skill)
-    
-    # Remove duplicates and return
-    return list(set(found_skills))
+    return list(_scan_skills(text.lower()))
 
 
-def extract_experience(text):
-    """Extract work experience from resume"""
-    experience = []
-    
+def _split_entries(section: str, delim_re: re.Pattern, min_len: int, max_entries: int) -> list[str]:
+    """Slice a section at delimiter positions, stopping once enough entries are kept"""
+    positions = [0] + [m.start() for m in delim_re.finditer(section)] + [len(section)]
+
+    entries = []
+    for i in range(len(positions) - 1):
+        entry = section[positions[i]:positions[i + 1]]
+        if len(entry.strip()) < min_len:  # Skip very short entries
+            continue
+        entries.append(entry)
+        if len(entries) >= max_entries:
+            break
+
+    return entries
+
+
+def experience_entries(text: str, offsets: list | None = None) -> list[str]:
+    """Collect work experience entries that need ORG lookup"""
     # Find experience section
-    exp_section = extract_section(text, ["experience", "work history", "employment", "professional experience"])
-    
+    exp_section = extract_section(text, ["experience", "work history", "employment", "professional experience"], offsets)
+
     if not exp_section:
-        return experience
-    
-    # Split by common delimiters (dates, newlines)
-    entries = re.split(r'\n(?=\d{4}|\w+\s+\d{4})', exp_section)
-    
-    for entry in entries:
-        if len(entry.strip()) < 20:  # Skip very short entries
-            continue
-        
+        return []
+
+    # Slice at common delimiters (dates, newlines), max 5 most recent
+    return _split_entries(exp_section, _EXP_SPLIT_RE, 20, 5)
+
+
+def extract_experience(entries: list[str], docs: list) -> list[dict]:
+    """Build work experience items from entries and their tokenized docs"""
+    experience = []
+
+    for entry, doc in zip(entries, docs):
         exp_item = {
             "title": None,
             "company": None,
             "duration": None,
             "description": None
         }
-        
+
         # Extract dates
-        date_matches = re.findall(r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}|\d{4})', entry, re.IGNORECASE)
+        date_matches = _DATE_RE.findall(entry)
         if date_matches:
             exp_item["duration"] = " - ".join(date_matches[:2])
-        
-        # Use NER to find organizations
-        doc = nlp(entry[:300])
-        orgs = [ent.text for ent in doc.ents if ent.label_ == "ORG"]
+
+        # Find organizations by suffix-term matching
+        orgs = extract_orgs(doc)
         if orgs:
             exp_item["company"] = orgs[0]
-        
+
         # First line often contains title
         lines = entry.strip().split('\n')
         if lines:
             exp_item["title"] = lines[0].strip()[:100]
-        
+
         exp_item["description"] = entry.strip()[:500]
-        
+
         experience.append(exp_item)
-    
-    return experience[:5]  # Return max 5 most recent
 
+    return experience
 
-def extract_education(text):
-    """Extract education details from resume"""
-    education = []
-    
+
+def education_entries(text: str, offsets: list | None = None) -> list[str]:
+    """Collect education entries that need ORG lookup"""
     # Find education section
-    edu_section = extract_section(text, ["education", "academic", "qualifications", "degree"])
-    
+    edu_section = extract_section(text, ["education", "academic", "qualifications", "degree"], offsets)
+
     if not edu_section:
-        return education
-    
-    # Common degree keywords
-    degrees = ["Bachelor", "Master", "PhD", "B.Tech", "M.Tech", "B.S.", "M.S.", 
-               "BA", "MA", "MBA", "B.E.", "M.E.", "Associate"]
-    
-    # Split by degree keywords or years
-    entries = re.split(r'\n(?=\d{4}|Bachelor|Master|PhD|B\.)', edu_section, flags=re.IGNORECASE)
-    
-    for entry in entries:
-        if len(entry.strip()) < 10:
-            continue
-        
+        return []
+
+    # Slice at degree keywords or years, max 3
+    return _split_entries(edu_section, _EDU_SPLIT_RE, 10, 3)
+
+
+def extract_education(entries: list[str], docs: list) -> list[dict]:
+    """Build education items from entries and their tokenized docs"""
+    education = []
+
+    for entry, doc in zip(entries, docs):
+        entry_lower = entry.lower()
+
         edu_item = {
             "degree": None,
             "institution": None,
             "year": None,
             "field": None
         }
-        
+
         # Find degree
-        for degree in degrees:
-            if degree.lower() in entry.lower():
-                edu_item["degree"] = degree
-                break
-        
+        edu_item["degree"] = next((orig for low, orig in _DEGREE_LOOKUP if low in entry_lower), None)
+
         # Extract year
-        year_matches = re.findall(r'\b(19\d{2}|20\d{2})\b', entry)
+        year_matches = _YEAR_RE.findall(entry)
         if year_matches:
             edu_item["year"] = year_matches[-1]  # Most recent year
-        
-        # Use NER to find institutions
-        doc = nlp(entry)
-        orgs = [ent.text for ent in doc.ents if ent.label_ == "ORG"]
+
+        # Find institutions by suffix-term matching
+        orgs = extract_orgs(doc)
         if orgs:
             edu_item["institution"] = orgs[0]
         
         education.append(edu_item)
-    
-    return education[:3]  # Return max 3
+
+    return education
+
+
+def find_section_offsets(text: str) -> list[tuple[str, int]]:
+    """Locate every section header in a single pass over the text"""
+    return [(m.group(1).lower(), m.start(1)) for m in _ALL_HEADERS_RE.finditer(text)]
 
 
-def extract_section(text, keywords):
+def extract_section(text: str, keywords: list[str], offsets: list | None = None) -> str | None:
     """Extract a section from resume based on keywords"""
-    text_lower = text.lower()
-    
-    # Find section start
-    start_pos = -1
-    for keyword in keywords:
-        pattern = rf'\b{keyword}\b'
-        match = re.search(pattern, text_lower)
-        if match:
-            start_pos = match.start()
-            break
-    
-    if start_pos == -1:
-        return None
-    
-    # Find section end (next major section or end of text)
-    section_headers = ["experience", "education", "skills", "projects", "certifications", 
-                      "awards", "summary", "objective", "references"]
-    
-    end_pos = len(text)
-    for header in section_headers:
-        pattern = rf'\n\s*\b{header}\b'
-        match = re.search(pattern, text_lower[start_pos + 50:])  # Skip current header
-        if match:
-            potential_end = start_pos + 50 + match.start()
-            if potential_end < end_pos:
-                end_pos = potential_end
-    
-    return text[start_pos:end_pos]
+    if offsets is None:
+        offsets = find_section_offsets(text)
+
+    for i, (header, start_pos) in enumerate(offsets):
+        if header in keywords:
+            # Only a major section header ends the section; start keywords for
+            # the same section (e.g. a "Degree:" line under "Education") don't
+            end_pos = len(text)
+            for next_header, next_pos in offsets[i + 1:]:
+                if next_header in SECTION_HEADERS and next_header not in keywords:
+                    end_pos = next_pos
+                    break
+            return text[start_pos:end_pos]
 
+    return None
 
-def extract_resume_data(text):
+
+def extract_resume_data(text: str) -> dict:
     """Main extraction function"""
     try:
-        # Extract all components
-        contact = extract_contact_info(text)
-        skills = extract_skills(text)
-        experience = extract_experience(text)
-        education = extract_education(text)
-        
+        # Segment the resume once, then run the independent extractors in parallel,
+        # each over just the slice it needs
+        offsets = find_section_offsets(text)
+
+        # Contact details live above the first section header
+        contact_end = max(offsets[0][1], 800) if offsets else len(text)
+
+        # Prefer the dedicated skills section, fall back to the full text
+        skills_section = extract_section(text, ["skills"], offsets)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            f_contact = executor.submit(extract_contact_info, text[:contact_end])
+            f_skills = executor.submit(extract_skills, skills_section or text)
+            f_exp = executor.submit(experience_entries, text, offsets)
+            f_edu = executor.submit(education_entries, text, offsets)
+
+            contact = f_contact.result()
+            skills = f_skills.result()
+            exp_entries = f_exp.result()
+            edu_entries = f_edu.result()
+
+        # Tokenize every snippet needing ORG lookup in one batch, hard-capped
+        # so one oversized entry cannot blow up tokenization; skip spaCy
+        # entirely when there is nothing to look up
+        snippets = [entry[:300] for entry in exp_entries] + [entry[:400] for entry in edu_entries]
+        docs = list(get_nlp().pipe(snippets, batch_size=16)) if snippets else []
+
+        contact["name"] = extract_name(text)
+        experience = extract_experience(exp_entries, docs[:len(exp_entries)])
+        education = extract_education(edu_entries, docs[len(exp_entries):])
+
         # Build result matching worker's expected format
         result = {
             "contact": contact,
@@ -269,21 +396,51 @@ def extract_resume_data(text):
         }
 
 
+def run_server() -> None:
+    """Serve many resumes over stdin, amortizing the spaCy model load.
+
+    Reads one JSON request {"text": ...} per line and emits one JSON result
+    per line, so a single long-running process replaces per-resume startups.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            payload = orjson.loads(line)
+            text = payload.get("text", "")[:_MAX_INPUT_BYTES]
+
+            if not text or len(text) < 50:
+                result = {"error": "Input text too short", "skipped": True}
+            else:
+                result = extract_resume_data(text)
+        except Exception as e:
+            result = {"error": str(e), "skipped": True}
+
+        sys.stdout.buffer.write(orjson.dumps(result) + b"\n")
+        sys.stdout.buffer.flush()
+
+
 if __name__ == "__main__":
+    if "--server" in sys.argv[1:]:
+        run_server()
+        sys.exit(0)
+
     try:
-        # Read resume text from stdin
-        raw_text = sys.stdin.read()
+        # Read resume text from stdin, capped at a sane maximum
+        raw_text = sys.stdin.buffer.read(_MAX_INPUT_BYTES).decode("utf-8", errors="replace")
         
         if not raw_text or len(raw_text) < 50:
-            print(json.dumps({"error": "Input text too short", "skipped": True}))
+            sys.stdout.buffer.write(orjson.dumps({"error": "Input text too short", "skipped": True}) + b"\n")
             sys.exit(1)
-        
+
         # Extract data
         result = extract_resume_data(raw_text)
-        
+
         # Output as JSON
-        print(json.dumps(result, indent=2, ensure_ascii=False))
-        
+        sys.stdout.buffer.write(orjson.dumps(result) + b"\n")
+
     except Exception as e:
-        print(json.dumps({"error": str(e), "skipped": True}), file=sys.stderr)
+        sys.stderr.buffer.write(orjson.dumps({"error": str(e), "skipped": True}) + b"\n")
         sys.exit(1)
\ No newline at end of file
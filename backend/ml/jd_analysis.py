@@ -1,29 +1,38 @@
 #!/usr/bin/env python3
 import sys
-import json
-import re
-import spacy
+import ahocorasick
+import orjson
 
-nlp = spacy.load("en_core_web_sm")
-
-SKILL_KEYWORDS = {
+# Canonical casing; the automaton below holds the lowered form
+SKILL_KEYWORDS = frozenset({
     "Python", "JavaScript", "Java", "C++", "Node.js", "React", "AWS", "Docker",
     "SQL", "MongoDB", "Machine Learning", "AI", "Kubernetes", "Flask", "Django",
     "Data Science", "TensorFlow", "HTML", "CSS", "Git", "Agile"
-}
+})
+
+# One-pass multi-pattern scanner over all keywords instead of one scan each
+_SKILL_AC = ahocorasick.Automaton()
+for _skill in SKILL_KEYWORDS:
+    _SKILL_AC.add_word(_skill.lower(), _skill)
+_SKILL_AC.make_automaton()
 
 def extract_skills_from_jd(text):
-    found_skills = []
     text_lower = text.lower()
-    for skill in SKILL_KEYWORDS:
-        if skill.lower() in text_lower:
-            found_skills.append(skill)
-    return list(set(found_skills))
+    found_skills = set()
+    for end, skill in _SKILL_AC.iter(text_lower):
+        start = end - len(skill) + 1
+        if start > 0 and text_lower[start - 1].isalnum():
+            continue
+        if end + 1 < len(text_lower) and text_lower[end + 1].isalnum():
+            continue
+        found_skills.add(skill)
+    return list(found_skills)
 
 def analyze_match(resume_skills, jd_skills):
-    matched = list(set(resume_skills) & set(jd_skills))
-    missing = list(set(jd_skills) - set(resume_skills))
-    match_percent = round((len(matched) / len(jd_skills)) * 100, 2) if jd_skills else 0
+    rs, js = set(resume_skills), set(jd_skills)
+    matched = list(rs & js)
+    missing = list(js - rs)
+    match_percent = round(len(matched) * 100 / len(js), 2) if js else 0
 
     tips = []
     if missing:
@@ -40,10 +49,10 @@ def analyze_match(resume_skills, jd_skills):
     }
 
 if __name__ == "__main__":
-    data = json.load(sys.stdin)
+    data = orjson.loads(sys.stdin.buffer.read())
     jd_text = data.get("job_description", "")
     resume_skills = data.get("resume_skills", [])
 
     jd_skills = extract_skills_from_jd(jd_text)
     result = analyze_match(resume_skills, jd_skills)
-    print(json.dumps(result, indent=2))
+    sys.stdout.buffer.write(orjson.dumps(result) + b"\n")
@@ -62,50 +62,79 @@ if (process.env.REDIS_PASSWORD && process.env.REDIS_PASSWORD.trim() !== "") {
 console.log(`🔗 Worker connecting to Redis: ${redisConfig.host}:${redisConfig.port}`);/* -------------------------------------------------------------------------- */
 /*                           NLP Extraction Helper                            */
 /* -------------------------------------------------------------------------- */
-async function runNLPExtraction(resumeText) {
-  return new Promise((resolve) => {
-    console.log("\n" + "=".repeat(70));
-    console.log("🤖 STARTING NLP EXTRACTION USING DOCKER CONTAINER");
-    console.log("=".repeat(70));
+// Persistent NLP worker: the container loads spaCy once and serves many
+// resumes over a line-based JSON protocol instead of one container per resume
+let nlpProcess = null;
+let nlpBuffer = "";
+const nlpQueue = [];
 
-    const python = spawn("docker", ["run", "-i", "resume-nlp"]);
-    let data = "";
-    let error = "";
+function startNLPProcess() {
+  console.log("\n" + "=".repeat(70));
+  console.log("🤖 STARTING PERSISTENT NLP WORKER (DOCKER CONTAINER)");
+  console.log("=".repeat(70));
 
-    python.stdout.on("data", (chunk) => {
-      const output = chunk.toString();
-      data += output;
-      console.log("🐍 [STDOUT]:", output.trim());
-    });
+  const child = spawn("docker", ["run", "-i", "resume-nlp", "python", "-u", "extract_resume.py", "--server"]);
+  nlpProcess = child;
+  nlpBuffer = "";
 
-    python.stderr.on("data", (chunk) => {
-      const errOutput = chunk.toString();
-      error += errOutput;
-      console.error("🐍 [STDERR]:", errOutput.trim());
-    });
+  child.stdout.on("data", (chunk) => {
+    nlpBuffer += chunk.toString();
+
+    let newlineIdx;
+    while ((newlineIdx = nlpBuffer.indexOf("\n")) !== -1) {
+      const line = nlpBuffer.slice(0, newlineIdx).trim();
+      nlpBuffer = nlpBuffer.slice(newlineIdx + 1);
+      if (!line) continue;
 
-    python.on("close", (code) => {
-      console.log(`🐍 Docker NLP exited with code ${code}`);
-      if (code !== 0) {
-        return resolve({ skipped: true, reason: "Docker NLP failed", stderr: error });
+      const pending = nlpQueue.shift();
+      if (!pending) {
+        console.warn("⚠️ NLP worker emitted a line with no pending request:", line.substring(0, 200));
+        continue;
       }
 
       try {
-        const jsonMatch = data.match(/\{[\s\S]*\}/);
-        if (!jsonMatch) throw new Error("No JSON found in output");
-        resolve(JSON.parse(jsonMatch[0]));
+        pending.resolve(JSON.parse(line));
       } catch (parseErr) {
         console.warn("⚠️ Failed to parse NLP JSON:", parseErr.message);
-        resolve({
+        pending.resolve({
           skipped: true,
           reason: "Invalid JSON output",
-          raw: data.substring(0, 500),
+          raw: line.substring(0, 500),
         });
       }
-    });
+    }
+  });
 
-    python.stdin.write(resumeText);
-    python.stdin.end();
+  child.stderr.on("data", (chunk) => {
+    console.error("🐍 [STDERR]:", chunk.toString().trim());
+  });
+
+  // Without this listener a write to a dead container emits an unhandled
+  // EPIPE error event and crashes the whole worker
+  child.stdin.on("error", (err) => {
+    console.error(`🐍 NLP worker stdin error: ${err.message}, restarting on next request`);
+    while (nlpQueue.length) {
+      nlpQueue.shift().resolve({ skipped: true, reason: "NLP worker pipe broken" });
+    }
+    if (nlpProcess === child) nlpProcess = null;
+    child.kill();
+  });
+
+  child.on("close", (code) => {
+    console.warn(`🐍 NLP worker exited with code ${code}, will restart on next request`);
+    while (nlpQueue.length) {
+      nlpQueue.shift().resolve({ skipped: true, reason: "NLP worker exited", code });
+    }
+    if (nlpProcess === child) nlpProcess = null;
+  });
+}
+
+async function runNLPExtraction(resumeText) {
+  if (!nlpProcess) startNLPProcess();
+
+  return new Promise((resolve) => {
+    nlpQueue.push({ resolve });
+    nlpProcess.stdin.write(JSON.stringify({ text: resumeText }) + "\n");
   });
 }
 